@@ -339,8 +339,6 @@ class ArrowBlockAccessor(TableBlockAccessor):
 
     def count(self, on: str) -> Optional[U]:
         """Count the number of non-null values in the provided column."""
-        import pyarrow.compute as pac
-
         if not isinstance(on, str):
             raise ValueError(
                 "on must be a string when aggregating on Arrow blocks, but got:"
@@ -351,7 +349,9 @@ class ArrowBlockAccessor(TableBlockAccessor):
             return None
 
         col = self._table[on]
-        return pac.count(col).as_py()
+        # The null count is cached array metadata, so unlike pac.count(), this
+        # doesn't scan the column's validity bitmap.
+        return len(col) - col.null_count
 
     def _apply_arrow_compute(
         self, compute_fn: Callable, on: str, ignore_nulls: bool
@@ -389,6 +389,22 @@ class ArrowBlockAccessor(TableBlockAccessor):
 
         return self._apply_arrow_compute(pac.max, on, ignore_nulls)
 
+    def min_max(self, on: str, ignore_nulls: bool) -> Optional[List[U]]:
+        import pyarrow.compute as pac
+
+        min_max = self._apply_arrow_compute(pac.min_max, on, ignore_nulls)
+        if min_max is None or min_max["min"] is None:
+            return None
+        return [min_max["min"], min_max["max"]]
+
+    def abs_max(self, on: str, ignore_nulls: bool) -> Optional[U]:
+        # Derive this from the column's min and max rather than from abs(col), which
+        # overflows for the smallest value of signed integer types.
+        min_max = self.min_max(on, ignore_nulls)
+        if min_max is None:
+            return None
+        return max(abs(min_max[0]), abs(min_max[1]))
+
     def mean(self, on: str, ignore_nulls: bool) -> Optional[U]:
         import pyarrow.compute as pac
 
@@ -416,6 +432,37 @@ class ArrowBlockAccessor(TableBlockAccessor):
             ignore_nulls,
         )
 
+    def std(self, on: str, ignore_nulls: bool) -> Optional[U]:
+        """Compute the [M2, mean, count] Welford accumulation for the provided column.
+
+        The sum of squared differences from the mean (M2) is derived from Arrow's
+        variance kernel, which avoids materializing a temporary (x - mean)**2 array
+        and is numerically stable, unlike a naive sum-of-squares formulation.
+        """
+        import pyarrow as pa
+        import pyarrow.compute as pac
+
+        if not isinstance(on, str):
+            raise ValueError(
+                "on must be a string when aggregating on Arrow blocks, but got:"
+                f"{type(on)}."
+            )
+
+        if self.num_rows() == 0:
+            return None
+
+        col = self._table[on]
+        if pa.types.is_null(col.type):
+            return None
+        # The null count is cached metadata, so this doesn't scan the column.
+        count = len(col) - col.null_count
+        if count == 0 or (count < len(col) and not ignore_nulls):
+            # All null, or ignore_nulls=False and at least one null.
+            return None
+        mean = pac.sum(col).as_py() / count
+        M2 = pac.variance(col, ddof=0).as_py() * count
+        return [M2, mean, count]
+
     def sort_and_partition(
         self, boundaries: List[T], key: "SortKeyT", descending: bool
     ) -> List["Block"]:
@@ -588,6 +635,7 @@ class ArrowBlockAccessor(TableBlockAccessor):
         )
         next_row = None
         builder = ArrowBlockBuilder()
+        rows = []
         while True:
             try:
                 if next_row is None:
@@ -637,18 +685,23 @@ class ArrowBlockAccessor(TableBlockAccessor):
                 if key is not None:
                     row[next_key_name] = next_key
 
-                for agg, agg_name, accumulator in zip(
-                    aggs, resolved_agg_names, accumulators
-                ):
-                    if finalize:
-                        row[agg_name] = agg.finalize(accumulator)
-                    else:
-                        row[agg_name] = accumulator
+                for agg_name, accumulator in zip(resolved_agg_names, accumulators):
+                    row[agg_name] = accumulator
 
-                builder.add(row)
+                rows.append(row)
             except StopIteration:
                 break
 
+        if finalize and rows:
+            # Finalize each aggregation across all groups at once, so that
+            # aggregations can vectorize their finalization.
+            for agg, agg_name in zip(aggs, resolved_agg_names):
+                results = agg._finalize_all([row[agg_name] for row in rows])
+                for row, result in zip(rows, results):
+                    row[agg_name] = result
+        for row in rows:
+            builder.add(row)
+
         ret = builder.build()
         return ret, ArrowBlockAccessor(ret).get_metadata(None, exec_stats=stats.build())
 
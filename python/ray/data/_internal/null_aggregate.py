@@ -1,4 +1,5 @@
-from typing import Tuple, Callable, Any, Union
+import functools
+from typing import Tuple, Callable, Any, List, Union
 from types import ModuleType
 
 import numpy as np
@@ -90,6 +91,9 @@ def _null_wrap_init(
     return _init
 
 
+# Memoized so that aggregations sharing the same core merge function (e.g. every
+# Sum(...)) also share a single null-handling merge.
+@functools.lru_cache(maxsize=None)
 def _null_wrap_merge(
     ignore_nulls: bool,
     merge: Callable[[AggType, AggType], AggType],
@@ -216,6 +220,11 @@ def _null_wrap_accumulate_block(
         ret = accum_block(block)
         if ret is not None:
             ret = _wrap_acc(ret, has_data=True)
+            if a is not None and a[-1] == 0:
+                # The base accumulation is empty, as it is when accumulating a
+                # single block per group, so the merge would just return the
+                # block accumulation. Skip its unwrapping and null checks.
+                return ret
         elif ignore_nulls:
             # This can happen if we're ignoring nulls but the entire block only consists
             # of nulls. We treat the block as if it were empty in this case.
@@ -251,6 +260,42 @@ def _null_wrap_finalize(
     return _finalize
 
 
+def _null_wrap_finalize_batch(
+    finalize_batch: Callable[[np.ndarray], np.ndarray]
+) -> Callable[[List[WrappedAggType]], List[U]]:
+    """
+    Wrap a vectorized finalizer with null handling.
+
+    The core finalizer is given the unwrapped accumulations of all non-empty groups
+    stacked into a single ndarray, so that it can finalize them in one vectorized
+    call. Empty or None accumulations finalize to None.
+
+    Args:
+        finalize_batch: The core vectorized finalizing function to wrap.
+
+    Returns:
+        A new batch finalizing function that handles nulls.
+    """
+
+    def _finalize_batch(accs: List[WrappedAggType]) -> List[U]:
+        results = [None] * len(accs)
+        indices, values = [], []
+        for i, a in enumerate(accs):
+            if a is None:
+                continue
+            a, has_data = _unwrap_acc(a)
+            if has_data:
+                indices.append(i)
+                values.append(a)
+        if values:
+            finalized = finalize_batch(np.array(values)).tolist()
+            for i, value in zip(indices, finalized):
+                results[i] = value
+        return results
+
+    return _finalize_batch
+
+
 LazyModule = Union[None, bool, ModuleType]
 _pandas: LazyModule = None
 
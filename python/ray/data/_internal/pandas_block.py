@@ -331,6 +331,21 @@ class PandasBlockAccessor(TableBlockAccessor):
     def max(self, on: str, ignore_nulls: bool) -> Optional[U]:
         return self._apply_agg(lambda col: col.max(skipna=ignore_nulls), on)
 
+    def min_max(self, on: str, ignore_nulls: bool) -> Optional[List[U]]:
+        min_ = self.min(on, ignore_nulls)
+        if min_ is None:
+            return None
+        return [min_, self.max(on, ignore_nulls)]
+
+    def abs_max(self, on: str, ignore_nulls: bool) -> Optional[U]:
+        # Derive this from the column's min and max rather than from col.abs(), which
+        # overflows for the smallest value of signed integer types.
+        min_max = self.min_max(on, ignore_nulls)
+        if min_max is None:
+            return None
+        # Convert NumPy integers to Python ints so that abs() can't overflow.
+        return max(abs(v.item() if isinstance(v, np.integer) else v) for v in min_max)
+
     def mean(self, on: str, ignore_nulls: bool) -> Optional[U]:
         return self._apply_agg(lambda col: col.mean(skipna=ignore_nulls), on)
 
@@ -347,6 +362,22 @@ class PandasBlockAccessor(TableBlockAccessor):
             on,
         )
 
+    def std(self, on: str, ignore_nulls: bool) -> Optional[U]:
+        """Compute the [M2, mean, count] Welford accumulation for a column."""
+        count = self.count(on)
+        if count == 0 or count is None:
+            # Empty or all null.
+            return None
+        sum_ = self.sum(on, ignore_nulls)
+        if sum_ is None:
+            # ignore_nulls=False and at least one null.
+            return None
+        M2 = self._apply_agg(
+            lambda col: col.var(ddof=0, skipna=ignore_nulls) * count,
+            on,
+        )
+        return [M2, sum_ / count, count]
+
     def sort_and_partition(
         self, boundaries: List[T], key: "SortKeyT", descending: bool
     ) -> List[Block]:
@@ -514,6 +545,7 @@ class PandasBlockAccessor(TableBlockAccessor):
         )
         next_row = None
         builder = PandasBlockBuilder()
+        rows = []
         while True:
             try:
                 if next_row is None:
@@ -561,18 +593,23 @@ class PandasBlockAccessor(TableBlockAccessor):
                 if key is not None:
                     row[next_key_name] = next_key
 
-                for agg, agg_name, accumulator in zip(
-                    aggs, resolved_agg_names, accumulators
-                ):
-                    if finalize:
-                        row[agg_name] = agg.finalize(accumulator)
-                    else:
-                        row[agg_name] = accumulator
+                for agg_name, accumulator in zip(resolved_agg_names, accumulators):
+                    row[agg_name] = accumulator
 
-                builder.add(row)
+                rows.append(row)
             except StopIteration:
                 break
 
+        if finalize and rows:
+            # Finalize each aggregation across all groups at once, so that
+            # aggregations can vectorize their finalization.
+            for agg, agg_name in zip(aggs, resolved_agg_names):
+                results = agg._finalize_all([row[agg_name] for row in rows])
+                for row, result in zip(rows, results):
+                    row[agg_name] = result
+        for row in rows:
+            builder.add(row)
+
         ret = builder.build()
         return ret, PandasBlockAccessor(ret).get_metadata(
             None, exec_stats=stats.build()
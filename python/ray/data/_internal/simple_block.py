@@ -1,5 +1,6 @@
 import random
 import heapq
+import operator
 from typing import Union, Callable, Iterator, List, Tuple, Any, Optional, TYPE_CHECKING
 
 import numpy as np
@@ -205,7 +206,7 @@ class SimpleBlockAccessor(BlockAccessor):
         return a if has_data else None
 
     def sum(self, on: str, ignore_nulls: bool) -> Optional[U]:
-        return self._apply_accum(0, lambda a, r: a + r, on, ignore_nulls)
+        return self._apply_accum(0, operator.add, on, ignore_nulls)
 
     def min(self, on: str, ignore_nulls: bool) -> Optional[U]:
         return self._apply_accum(float("inf"), min, on, ignore_nulls)
@@ -213,6 +214,17 @@ class SimpleBlockAccessor(BlockAccessor):
     def max(self, on: str, ignore_nulls: bool) -> Optional[U]:
         return self._apply_accum(float("-inf"), max, on, ignore_nulls)
 
+    def min_max(self, on: str, ignore_nulls: bool) -> Optional[List[U]]:
+        return self._apply_accum(
+            [float("inf"), float("-inf")],
+            lambda a, r: [min(a[0], r), max(a[1], r)],
+            on,
+            ignore_nulls,
+        )
+
+    def abs_max(self, on: str, ignore_nulls: bool) -> Optional[U]:
+        return self._apply_accum(0, lambda a, r: max(a, abs(r)), on, ignore_nulls)
+
     def mean(self, on: str, ignore_nulls: bool) -> Optional[U]:
         return self._apply_accum(
             [0, 0],
@@ -397,7 +409,7 @@ class SimpleBlockAccessor(BlockAccessor):
         """
 
         stats = BlockExecStats.builder()
-        key_fn = (lambda r: r[0]) if key else (lambda r: 0)
+        key_fn = operator.itemgetter(0) if key else (lambda r: 0)
 
         iter = heapq.merge(
             *[SimpleBlockAccessor(block).iter_rows(True) for block in blocks],
@@ -434,30 +446,23 @@ class SimpleBlockAccessor(BlockAccessor):
                             accumulators[i] = aggs[i].merge(
                                 accumulators[i], r[i + 1] if key else r[i]
                             )
-                if finalize:
-                    if key is None:
-                        ret.append(
-                            tuple(
-                                agg.finalize(accumulator)
-                                for agg, accumulator in zip(aggs, accumulators)
-                            )
-                        )
-                    else:
-                        ret.append(
-                            (next_key,)
-                            + tuple(
-                                agg.finalize(accumulator)
-                                for agg, accumulator in zip(aggs, accumulators)
-                            )
-                        )
+                if key is None:
+                    ret.append(tuple(accumulators))
                 else:
-                    if key is None:
-                        ret.append(tuple(accumulators))
-                    else:
-                        ret.append((next_key,) + tuple(accumulators))
+                    ret.append((next_key,) + tuple(accumulators))
             except StopIteration:
                 break
 
+        if finalize and ret and aggs:
+            # Finalize each aggregation across all groups at once, so that
+            # aggregations can vectorize their finalization.
+            offset = 1 if key else 0
+            results = [
+                agg._finalize_all([r[i + offset] for r in ret])
+                for i, agg in enumerate(aggs)
+            ]
+            ret = [r[:offset] + row for r, row in zip(ret, zip(*results))]
+
         return ret, SimpleBlockAccessor(ret).get_metadata(
             None, exec_stats=stats.build()
         )
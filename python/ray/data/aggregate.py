@@ -1,5 +1,12 @@
+import collections
+import copy
+import datetime
+import functools
 import math
-from typing import Callable, Optional, List, TYPE_CHECKING, Union
+import operator
+from typing import Callable, Dict, Optional, List, TYPE_CHECKING, Union
+
+import numpy as np
 
 from ray.util.annotations import PublicAPI
 from ray.data.block import (
@@ -16,15 +23,54 @@ from ray.data._internal.null_aggregate import (
     _null_wrap_merge,
     _null_wrap_accumulate_block,
     _null_wrap_finalize,
-    _null_wrap_accumulate_row,
+    _null_wrap_finalize_batch,
+    _is_null,
 )
 
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
 if TYPE_CHECKING:
     import pyarrow as pa
 
 
+# Cache of block type -> accessor class, for block types whose accessor directly
+# wraps the block.
+_ACCESSOR_CACHE: Dict[type, type] = {}
+
+
+def _block_accessor(block: Block) -> BlockAccessor:
+    """Create a block accessor for the given block.
+
+    Equivalent to BlockAccessor.for_block(), but skips its per-call imports and
+    isinstance dispatch for block types that have been seen before. Aggregations
+    create an accessor for every block they touch, so this is on the hot path.
+    """
+    cls = _ACCESSOR_CACHE.get(type(block))
+    if cls is not None:
+        return cls(block)
+    block_acc = BlockAccessor.for_block(block)
+    # Only cache accessors that wrap the block as-is: serialized Arrow blocks
+    # need to be deserialized, and simple blocks are subject to a strict mode
+    # check on every call.
+    if block_acc.to_block() is block and not isinstance(block, list):
+        _ACCESSOR_CACHE[type(block)] = type(block_acc)
+    return block_acc
+
+
 @PublicAPI
 class AggregateFn:
+    __slots__ = (
+        "init",
+        "merge",
+        "accumulate_block",
+        "finalize",
+        "name",
+        "finalize_batch",
+    )
+
     def __init__(
         self,
         init: Callable[[KeyType], AggType],
@@ -33,6 +79,7 @@ class AggregateFn:
         accumulate_block: Callable[[AggType, Block], AggType] = None,
         finalize: Callable[[AggType], U] = lambda a: a,
         name: Optional[str] = None,
+        finalize_batch: Optional[Callable[[List[AggType]], List[U]]] = None,
     ):
         """Defines an aggregate function in the accumulator style.
 
@@ -59,6 +106,9 @@ class AggregateFn:
                 result from the fully merged accumulator.
             name: The name of the aggregation. This will be used as the output
                 column name in the case of Arrow dataset.
+            finalize_batch: Optional vectorized alternative to finalize. If provided,
+                this is given the fully merged accumulators of all groups at once,
+                and returns the list of final aggregation results.
         """
         if (accumulate_row is None and accumulate_block is None) or (
             accumulate_row is not None and accumulate_block is not None
@@ -69,7 +119,7 @@ class AggregateFn:
         if accumulate_block is None:
 
             def accumulate_block(a: AggType, block: Block) -> AggType:
-                block_acc = BlockAccessor.for_block(block)
+                block_acc = _block_accessor(block)
                 for r in block_acc.iter_rows(public_row_format=False):
                     a = accumulate_row(a, r)
                 return a
@@ -79,6 +129,16 @@ class AggregateFn:
         self.accumulate_block = accumulate_block
         self.finalize = finalize
         self.name = name
+        self.finalize_batch = finalize_batch
+
+    def _finalize_all(self, accumulators: List[AggType]) -> List[U]:
+        """Finalize the fully merged accumulators of all groups."""
+        # User subclasses may set up the aggregation without calling
+        # AggregateFn.__init__, leaving finalize_batch unset.
+        finalize_batch = getattr(self, "finalize_batch", None)
+        if finalize_batch is not None:
+            return finalize_batch(accumulators)
+        return [self.finalize(a) for a in accumulators]
 
     def _validate(self, schema: Optional[Union[type, "pa.lib.Schema"]]) -> None:
         """Raise an error if this cannot be applied to the given schema."""
@@ -86,6 +146,8 @@ class AggregateFn:
 
 
 class _AggregateOnKeyBase(AggregateFn):
+    __slots__ = ("_key_fn", "_rs_name", "_ignore_nulls")
+
     def _set_key_fn(self, on: str):
         self._key_fn = on
 
@@ -97,13 +159,13 @@ class _AggregateOnKeyBase(AggregateFn):
 class Count(AggregateFn):
     """Defines count aggregation."""
 
+    __slots__ = ()
+
     def __init__(self):
         super().__init__(
-            init=lambda k: 0,
-            accumulate_block=(
-                lambda a, block: a + BlockAccessor.for_block(block).num_rows()
-            ),
-            merge=lambda a1, a2: a1 + a2,
+            init=_zero_init,
+            accumulate_block=_count_accumulate_block,
+            merge=operator.add,
             name="count()",
         )
 
@@ -112,6 +174,8 @@ class Count(AggregateFn):
 class Sum(_AggregateOnKeyBase):
     """Defines sum aggregation."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         on: Optional[str] = None,
@@ -123,18 +187,19 @@ class Sum(_AggregateOnKeyBase):
             self._rs_name = alias_name
         else:
             self._rs_name = f"sum({str(on)})"
+        self._ignore_nulls = ignore_nulls
 
-        null_merge = _null_wrap_merge(ignore_nulls, lambda a1, a2: a1 + a2)
+        null_merge = _null_wrap_merge(ignore_nulls, operator.add)
 
         super().__init__(
-            init=_null_wrap_init(lambda k: 0),
+            init=_null_wrap_init(_zero_init),
             merge=null_merge,
             accumulate_block=_null_wrap_accumulate_block(
                 ignore_nulls,
-                lambda block: BlockAccessor.for_block(block).sum(on, ignore_nulls),
+                lambda block: _block_accessor(block).sum(on, ignore_nulls),
                 null_merge,
             ),
-            finalize=_null_wrap_finalize(lambda a: a),
+            finalize=_null_wrap_finalize(_identity),
             name=(self._rs_name),
         )
 
@@ -143,6 +208,8 @@ class Sum(_AggregateOnKeyBase):
 class Min(_AggregateOnKeyBase):
     """Defines min aggregation."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         on: Optional[str] = None,
@@ -154,18 +221,19 @@ class Min(_AggregateOnKeyBase):
             self._rs_name = alias_name
         else:
             self._rs_name = f"min({str(on)})"
+        self._ignore_nulls = ignore_nulls
 
         null_merge = _null_wrap_merge(ignore_nulls, min)
 
         super().__init__(
-            init=_null_wrap_init(lambda k: float("inf")),
+            init=_null_wrap_init(_min_init),
             merge=null_merge,
             accumulate_block=_null_wrap_accumulate_block(
                 ignore_nulls,
-                lambda block: BlockAccessor.for_block(block).min(on, ignore_nulls),
+                lambda block: _block_accessor(block).min(on, ignore_nulls),
                 null_merge,
             ),
-            finalize=_null_wrap_finalize(lambda a: a),
+            finalize=_null_wrap_finalize(_identity),
             name=(self._rs_name),
         )
 
@@ -174,6 +242,8 @@ class Min(_AggregateOnKeyBase):
 class Max(_AggregateOnKeyBase):
     """Defines max aggregation."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         on: Optional[str] = None,
@@ -185,18 +255,19 @@ class Max(_AggregateOnKeyBase):
             self._rs_name = alias_name
         else:
             self._rs_name = f"max({str(on)})"
+        self._ignore_nulls = ignore_nulls
 
         null_merge = _null_wrap_merge(ignore_nulls, max)
 
         super().__init__(
-            init=_null_wrap_init(lambda k: float("-inf")),
+            init=_null_wrap_init(_max_init),
             merge=null_merge,
             accumulate_block=_null_wrap_accumulate_block(
                 ignore_nulls,
-                lambda block: BlockAccessor.for_block(block).max(on, ignore_nulls),
+                lambda block: _block_accessor(block).max(on, ignore_nulls),
                 null_merge,
             ),
-            finalize=_null_wrap_finalize(lambda a: a),
+            finalize=_null_wrap_finalize(_identity),
             name=(self._rs_name),
         )
 
@@ -205,6 +276,8 @@ class Max(_AggregateOnKeyBase):
 class Mean(_AggregateOnKeyBase):
     """Defines mean aggregation."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         on: Optional[str] = None,
@@ -216,13 +289,12 @@ class Mean(_AggregateOnKeyBase):
             self._rs_name = alias_name
         else:
             self._rs_name = f"mean({str(on)})"
+        self._ignore_nulls = ignore_nulls
 
-        null_merge = _null_wrap_merge(
-            ignore_nulls, lambda a1, a2: [a1[0] + a2[0], a1[1] + a2[1]]
-        )
+        null_merge = _null_wrap_merge(ignore_nulls, _mean_merge)
 
         def vectorized_mean(block: Block) -> AggType:
-            block_acc = BlockAccessor.for_block(block)
+            block_acc = _block_accessor(block)
             count = block_acc.count(on)
             if count == 0 or count is None:
                 # Empty or all null.
@@ -234,15 +306,16 @@ class Mean(_AggregateOnKeyBase):
             return [sum_, count]
 
         super().__init__(
-            init=_null_wrap_init(lambda k: [0, 0]),
+            init=_null_wrap_init(_mean_init),
             merge=null_merge,
             accumulate_block=_null_wrap_accumulate_block(
                 ignore_nulls,
                 vectorized_mean,
                 null_merge,
             ),
-            finalize=_null_wrap_finalize(lambda a: a[0] / a[1]),
+            finalize=_null_wrap_finalize(_mean_finalize),
             name=(self._rs_name),
+            finalize_batch=_null_wrap_finalize_batch(_mean_finalize_batch),
         )
 
 
@@ -259,6 +332,8 @@ class Std(_AggregateOnKeyBase):
     https://en.wikipedia.org/wiki/Algorithms_for_calculating_variance#Welford's_online_algorithm
     """
 
+    __slots__ = ()
+
     def __init__(
         self,
         on: Optional[str] = None,
@@ -271,58 +346,26 @@ class Std(_AggregateOnKeyBase):
             self._rs_name = alias_name
         else:
             self._rs_name = f"std({str(on)})"
+        self._ignore_nulls = ignore_nulls
 
-        def merge(a: List[float], b: List[float]):
-            # Merges two accumulations into one.
-            # See
-            # https://en.wikipedia.org/wiki/Algorithms_for_calculating_variance#Parallel_algorithm
-            M2_a, mean_a, count_a = a
-            M2_b, mean_b, count_b = b
-            delta = mean_b - mean_a
-            count = count_a + count_b
-            # NOTE: We use this mean calculation since it's more numerically
-            # stable than mean_a + delta * count_b / count, which actually
-            # deviates from Pandas in the ~15th decimal place and causes our
-            # exact comparison tests to fail.
-            mean = (mean_a * count_a + mean_b * count_b) / count
-            # Update the sum of squared differences.
-            M2 = M2_a + M2_b + (delta**2) * count_a * count_b / count
-            return [M2, mean, count]
-
-        null_merge = _null_wrap_merge(ignore_nulls, merge)
+        null_merge = _null_wrap_merge(ignore_nulls, _std_merge)
 
         def vectorized_std(block: Block) -> AggType:
-            block_acc = BlockAccessor.for_block(block)
-            count = block_acc.count(on)
-            if count == 0 or count is None:
-                # Empty or all null.
-                return None
-            sum_ = block_acc.sum(on, ignore_nulls)
-            if sum_ is None:
-                # ignore_nulls=False and at least one null.
-                return None
-            mean = sum_ / count
-            M2 = block_acc.sum_of_squared_diffs_from_mean(on, ignore_nulls, mean)
-            return [M2, mean, count]
-
-        def finalize(a: List[float]):
-            # Compute the final standard deviation from the accumulated
-            # sum of squared differences from current mean and the count.
-            M2, mean, count = a
-            if count < 2:
-                return 0.0
-            return math.sqrt(M2 / (count - ddof))
+            return _block_accessor(block).std(on, ignore_nulls)
 
         super().__init__(
-            init=_null_wrap_init(lambda k: [0, 0, 0]),
+            init=_null_wrap_init(_std_init),
             merge=null_merge,
             accumulate_block=_null_wrap_accumulate_block(
                 ignore_nulls,
                 vectorized_std,
                 null_merge,
             ),
-            finalize=_null_wrap_finalize(finalize),
+            finalize=_null_wrap_finalize(functools.partial(_std_finalize, ddof=ddof)),
             name=(self._rs_name),
+            finalize_batch=_null_wrap_finalize_batch(
+                functools.partial(_std_finalize_batch, ddof=ddof)
+            ),
         )
 
 
@@ -330,6 +373,8 @@ class Std(_AggregateOnKeyBase):
 class AbsMax(_AggregateOnKeyBase):
     """Defines absolute max aggregation."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         on: Optional[str] = None,
@@ -337,36 +382,244 @@ class AbsMax(_AggregateOnKeyBase):
         alias_name: Optional[str] = None,
     ):
         self._set_key_fn(on)
-        on_fn = _to_on_fn(on)
         if alias_name:
             self._rs_name = alias_name
         else:
             self._rs_name = f"abs_max({str(on)})"
 
+        null_merge = _null_wrap_merge(ignore_nulls, max)
+
         super().__init__(
-            init=_null_wrap_init(lambda k: 0),
-            merge=_null_wrap_merge(ignore_nulls, max),
-            accumulate_row=_null_wrap_accumulate_row(
-                ignore_nulls, on_fn, lambda a, r: max(a, abs(r))
+            init=_null_wrap_init(_zero_init),
+            merge=null_merge,
+            accumulate_block=_null_wrap_accumulate_block(
+                ignore_nulls,
+                lambda block: _block_accessor(block).abs_max(on, ignore_nulls),
+                null_merge,
             ),
-            finalize=_null_wrap_finalize(lambda a: a),
+            finalize=_null_wrap_finalize(_identity),
             name=(self._rs_name),
         )
 
 
-def _to_on_fn(on: Optional[str]):
-    if on is None:
-        return lambda r: r
-    elif isinstance(on, str):
-        return lambda r: r[on]
+def _block_values(
+    block: Block, on: Optional[str], ignore_nulls: bool
+) -> Optional[List[T]]:
+    """Return the values of the given column as a list, with nulls dropped.
+
+    Returns None if ignore_nulls=False and at least one value is null.
+    """
+    block_acc = _block_accessor(block)
+    if block_acc.num_rows() == 0:
+        return []
+    values = block_acc.to_numpy(on)
+    nulls = _is_null(values)
+    has_nulls = nulls.any()
+    if has_nulls and not ignore_nulls:
+        return None
+    if has_nulls:
+        values = values[~nulls]
+    if values.dtype.kind in "mM":
+        # tolist() would turn e.g. datetime64[ns] values into integer nanoseconds,
+        # so keep them as NumPy datetime/timedelta scalars.
+        return list(values)
+    return values.tolist()
+
+
+def _zero_init(k: KeyType) -> int:
+    return 0
+
+
+def _identity(a: AggType) -> AggType:
+    return a
+
+
+def _count_accumulate_block(a: int, block: Block) -> int:
+    # Arrow tables expose their row count as an attribute, so we can skip creating
+    # a block accessor, which dominates the cost of counting small blocks.
+    if pyarrow is None or not isinstance(block, pyarrow.Table):
+        return a + _block_accessor(block).num_rows()
+    # Arrow may represent an empty table via an N > 0 row, 0-column table, e.g. when
+    # slicing an empty table, so we count 0 rows if num_columns == 0.
+    return a + (block.num_rows if block.num_columns > 0 else 0)
+
+
+# Shared sentinels, so that initializing a group doesn't parse and allocate a new
+# float each time.
+_POS_INF = float("inf")
+_NEG_INF = float("-inf")
+
+
+def _min_init(k: KeyType) -> float:
+    return _POS_INF
+
+
+def _max_init(k: KeyType) -> float:
+    return _NEG_INF
+
+
+def _mean_init(k: KeyType) -> List[float]:
+    return [0, 0]
+
+
+def _mean_finalize(a: List[float]) -> float:
+    return a[0] / a[1]
+
+
+# Integers up to this magnitude convert to float64 exactly.
+_MAX_EXACT_FLOAT_INT = 2**53
+
+
+def _mean_finalize_batch(a: np.ndarray) -> np.ndarray:
+    # Vectorized _mean_finalize over an (N, 2) array of [sum, count] accumulations.
+    sums, counts = a[:, 0], a[:, 1]
+    if a.dtype.kind == "f" or (
+        a.dtype.kind in "iu"
+        and (sums >= -_MAX_EXACT_FLOAT_INT).all()
+        and (sums <= _MAX_EXACT_FLOAT_INT).all()
+        and (counts <= _MAX_EXACT_FLOAT_INT).all()
+    ):
+        # Both operands are exact in float64, so the float division is correctly
+        # rounded, like Python's true division in _mean_finalize.
+        return sums.astype(np.float64) / counts.astype(np.float64)
+    # Integer sums that don't fit exactly in a float64 (possibly held as Python
+    # ints in an object array): fall back to Python's true division.
+    return np.array([_mean_finalize(acc) for acc in a.tolist()])
+
+
+def _mean_merge(a: List[float], b: List[float]) -> List[float]:
+    # Merges two [sum, count] accumulations into one.
+    return [a[0] + b[0], a[1] + b[1]]
+
+
+def _std_merge(a: List[float], b: List[float]) -> List[float]:
+    # Merges two accumulations into one.
+    # See
+    # https://en.wikipedia.org/wiki/Algorithms_for_calculating_variance#Parallel_algorithm
+    M2_a, mean_a, count_a = a
+    M2_b, mean_b, count_b = b
+    delta = mean_b - mean_a
+    count = count_a + count_b
+    if count_a == count_b:
+        # Equally-sized partitions (common in tree reductions): averaging the two
+        # means directly incurs a single rounding.
+        mean = (mean_a + mean_b) / 2
+    else:
+        # Shift the mean by the weighted difference rather than recombining the
+        # two weighted sums, which avoids cancellation when one partition is
+        # orders of magnitude larger than the other.
+        mean = mean_a + delta * count_b / count
+    # Update the sum of squared differences.
+    M2 = M2_a + M2_b + delta * delta * count_a * count_b / count
+    return [M2, mean, count]
+
+
+def _std_init(k: KeyType) -> List[float]:
+    return [0, 0, 0]
+
+
+def _std_finalize(a: List[float], ddof: int) -> float:
+    # Compute the final standard deviation from the accumulated
+    # sum of squared differences from current mean and the count.
+    M2, mean, count = a
+    if count < 2:
+        return 0.0
+    if count <= ddof:
+        # Like pandas, the standard deviation is undefined for N - ddof <= 0.
+        return math.nan
+    return math.sqrt(M2 / (count - ddof))
+
+
+def _std_finalize_batch(a: np.ndarray, ddof: int) -> np.ndarray:
+    # Vectorized _std_finalize over an (N, 3) array of [M2, mean, count]
+    # accumulations.
+    if a.dtype.kind == "O":
+        # E.g. decimal columns, whose accumulations hold Decimal means, don't stack
+        # into a float array, so finalize them one at a time.
+        return np.array([_std_finalize(acc, ddof) for acc in a.tolist()])
+    M2, count = a[:, 0], a[:, 2]
+    # Groups with fewer than 2 values or with N - ddof <= 0 are overwritten below,
+    # so ignore the division warnings they raise.
+    with np.errstate(divide="ignore", invalid="ignore"):
+        std = np.sqrt(M2 / (count - ddof))
+    std[count <= ddof] = np.nan
+    std[count < 2] = 0.0
+    return std
+
+
+# Quantile accumulates the list of non-null values seen so far, or None once a null
+# was seen with ignore_nulls=False. An empty list marks an empty accumulation, so
+# unlike the other aggregations, it doesn't need the null_aggregate wrappers, whose
+# integer has_data flag couldn't be stored in the same list column as e.g.
+# datetime or string values in the partially combined blocks.
+
+
+def _quantile_init(k: KeyType) -> List[T]:
+    return []
+
+
+def _quantile_values(a: AggType) -> List[T]:
+    # Partially combined blocks may hand accumulations back as ndarrays.
+    if isinstance(a, np.ndarray):
+        a = list(a) if a.dtype.kind in "mM" else a.tolist()
+    # Arrow hands datetimes and timedeltas back as Python objects, which the block
+    # builders can't store in a list column, so convert them back to NumPy scalars.
+    if a and isinstance(a[0], datetime.datetime):
+        a = list(np.array(a, dtype="datetime64[ns]"))
+    elif a and isinstance(a[0], datetime.timedelta):
+        a = list(np.array(a, dtype="timedelta64[ns]"))
+    return a
+
+
+def _quantile_merge(a: Optional[List[T]], b: Optional[List[T]]) -> Optional[List[T]]:
+    if a is None or b is None:
+        return None
+    return _quantile_values(a) + _quantile_values(b)
+
+
+def _quantile_finalize(a: Optional[List[T]], q: float) -> Optional[U]:
+    if a is None or len(a) == 0:
+        return None
+    return _percentile(a, q)
+
+
+def _percentile(input_values: List[T], q: float) -> U:
+    # Select only the (at most two) order statistics that the linear
+    # interpolation needs, which is O(n), rather than sorting all values.
+    arr = np.atleast_1d(np.asarray(input_values))
+    k = (len(arr) - 1) * q
+    f = math.floor(k)
+    c = math.ceil(k)
+    arr = np.partition(arr, [f, c] if f != c else f)
+    if f == c:
+        value = arr[f]
+        if arr.dtype.kind in "iuf":
+            return float(value)
+        if arr.dtype.kind in "mM" or not isinstance(value, np.generic):
+            # Return other values, e.g. datetimes or strings, as they are. (item()
+            # would turn datetime64[ns] values into integer nanoseconds.)
+            return value
+        return value.item()
+    # Interpolate like numpy's default "linear" method, which measures from the
+    # nearer of the two values, so that results match np.quantile exactly.
+    lo, hi = arr[f], arr[c]
+    if arr.dtype.kind == "b":
+        # NumPy doesn't support subtracting booleans.
+        lo, hi = float(lo), float(hi)
+    t = k - f
+    if t >= 0.5:
+        value = hi - (hi - lo) * (1 - t)
     else:
-        return on
+        value = lo + (hi - lo) * t
+    return float(value) if arr.dtype.kind in "biuf" else value
 
 
 @PublicAPI
 class Quantile(_AggregateOnKeyBase):
     """Defines Quantile aggregation."""
 
+    __slots__ = ("_q",)
+
     def __init__(
         self,
         on: Optional[str] = None,
@@ -381,58 +634,137 @@ class Quantile(_AggregateOnKeyBase):
         else:
             self._rs_name = f"quantile({str(on)})"
 
-        def merge(a: List[int], b: List[int]):
-            if isinstance(a, List) and isinstance(b, List):
-                a.extend(b)
-                return a
-            if isinstance(a, List) and (not isinstance(b, List)):
-                if b is not None and b != "":
-                    a.append(b)
-                return a
-            if isinstance(b, List) and (not isinstance(a, List)):
-                if a is not None and a != "":
-                    b.append(a)
-                return b
-
-            ls = []
-            if a is not None and a != "":
-                ls.append(a)
-            if b is not None and b != "":
-                ls.append(b)
-            return ls
-
-        null_merge = _null_wrap_merge(ignore_nulls, merge)
-
-        def block_row_ls(block: Block) -> AggType:
-            block_acc = BlockAccessor.for_block(block)
-            ls = []
-            for row in block_acc.iter_rows(public_row_format=False):
-                ls.append(row.get(on))
-            return ls
-
-        import math
-
-        def percentile(input_values, key=lambda x: x):
-            if not input_values:
-                return None
-            input_values = sorted(input_values)
-            k = (len(input_values) - 1) * self._q
-            f = math.floor(k)
-            c = math.ceil(k)
-            if f == c:
-                return key(input_values[int(k)])
-            d0 = key(input_values[int(f)]) * (c - k)
-            d1 = key(input_values[int(c)]) * (k - f)
-            return round(d0 + d1, 5)
+        def block_row_ls(a: AggType, block: Block) -> AggType:
+            # The accumulator is stored in the partially combined blocks, so keep it
+            # as a flat list of Python values rather than an ndarray.
+            return _quantile_merge(a, _block_values(block, on, ignore_nulls))
 
         super().__init__(
-            init=_null_wrap_init(lambda k: [0]),
-            merge=null_merge,
-            accumulate_block=_null_wrap_accumulate_block(
-                ignore_nulls,
-                block_row_ls,
-                null_merge,
-            ),
-            finalize=_null_wrap_finalize(percentile),
+            init=_quantile_init,
+            merge=_quantile_merge,
+            accumulate_block=block_row_ls,
+            finalize=functools.partial(_quantile_finalize, q=q),
             name=(self._rs_name),
         )
+
+
+def _sum_block(get: Callable[[str], AggType]) -> AggType:
+    return get("sum")
+
+
+def _min_block(get: Callable[[str], AggType]) -> AggType:
+    min_max = get("min_max")
+    return None if min_max is None else min_max[0]
+
+
+def _max_block(get: Callable[[str], AggType]) -> AggType:
+    min_max = get("min_max")
+    return None if min_max is None else min_max[1]
+
+
+def _mean_block(get: Callable[[str], AggType]) -> AggType:
+    count = get("count")
+    if count == 0 or count is None:
+        # Empty or all null.
+        return None
+    sum_ = get("sum")
+    if sum_ is None:
+        # ignore_nulls=False and at least one null.
+        return None
+    return [sum_, count]
+
+
+def _std_block(get: Callable[[str], AggType]) -> AggType:
+    return get("std")
+
+
+# Built-in aggregations whose block accumulation can be computed from shared
+# block accessor computations ("stats"), mapped to the stats they need and to a
+# function deriving their block accumulation from those stats.
+_FUSABLE = {
+    Sum: (("sum",), _sum_block),
+    Min: (("min_max",), _min_block),
+    Max: (("min_max",), _max_block),
+    Mean: (("count", "sum"), _mean_block),
+    Std: (("std",), _std_block),
+}
+
+
+class _SharedColumnScan:
+    """Shares block accessor computations between aggregations on the same column.
+
+    This lets e.g. a Sum and a Mean on the same column sum each block once, and a
+    Min and a Max share a single min_max() pass. Stats are cached for the most
+    recently seen block object, and dropped once every aggregation sharing this
+    scan has accumulated that block.
+    """
+
+    __slots__ = ("_on", "_ignore_nulls", "_num_consumers", "_state")
+
+    def __init__(self, on: Optional[str], ignore_nulls: bool, num_consumers: int):
+        self._on = on
+        self._ignore_nulls = ignore_nulls
+        self._num_consumers = num_consumers
+        # [block, {stat: value}, number of consumers yet to accumulate the block]
+        self._state = None
+
+    def _get(self, state: list, stat: str) -> AggType:
+        stats = state[1]
+        if stat not in stats:
+            block_acc = _block_accessor(state[0])
+            if stat == "count":
+                stats[stat] = block_acc.count(self._on)
+            else:
+                stats[stat] = getattr(block_acc, stat)(self._on, self._ignore_nulls)
+        return stats[stat]
+
+    def accumulate(
+        self, block: Block, block_fn: Callable[[Callable[[str], AggType]], AggType]
+    ) -> AggType:
+        state = self._state
+        if state is None or state[0] is not block:
+            state = [block, {}, self._num_consumers]
+            self._state = state
+        ret = block_fn(lambda stat: self._get(state, stat))
+        state[2] -= 1
+        if state[2] == 0:
+            self._state = None
+        return ret
+
+
+def _coalesce_aggregations(aggs: List[AggregateFn]) -> List[AggregateFn]:
+    """Fuse built-in aggregations on the same column that need the same stats.
+
+    Returns a new list of aggregations, in which aggregations on the same column
+    (with the same null handling) that need a common block computation, e.g. a Min
+    and a Max, share it through a _SharedColumnScan instead of each scanning the
+    column. The given aggregations are not modified, and the output names and
+    order are unchanged.
+    """
+    groups = collections.defaultdict(list)
+    for i, agg in enumerate(aggs):
+        if type(agg) in _FUSABLE:
+            groups[(agg._key_fn, agg._ignore_nulls)].append(i)
+
+    aggs = list(aggs)
+    for (on, ignore_nulls), indices in groups.items():
+        stat_counts = collections.Counter(
+            stat for i in indices for stat in _FUSABLE[type(aggs[i])][0]
+        )
+        fused = [
+            i
+            for i in indices
+            if any(stat_counts[stat] > 1 for stat in _FUSABLE[type(aggs[i])][0])
+        ]
+        if not fused:
+            continue
+        scan = _SharedColumnScan(on, ignore_nulls, len(fused))
+        for i in fused:
+            agg = copy.copy(aggs[i])
+            agg.accumulate_block = _null_wrap_accumulate_block(
+                ignore_nulls,
+                functools.partial(scan.accumulate, block_fn=_FUSABLE[type(agg)][1]),
+                agg.merge,
+            )
+            aggs[i] = agg
+    return aggs
@@ -19,6 +19,7 @@ from ray.data.aggregate import (
     Min,
     Std,
     Sum,
+    _coalesce_aggregations,
 )
 from ray.data.block import (
     Block,
@@ -148,6 +149,7 @@ class GroupedData:
             results of the aggregations.
             If groupby key is ``None`` then the key part of return is omitted.
         """
+        aggs = _coalesce_aggregations(aggs)
 
         def do_agg(blocks, task_ctx: TaskContext, clear_input_blocks: bool, *_):
             # TODO: implement clear_input_blocks
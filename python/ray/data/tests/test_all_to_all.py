@@ -1,3 +1,4 @@
+import decimal
 import itertools
 import math
 import random
@@ -9,7 +10,19 @@ import pyarrow as pa
 import pytest
 
 import ray
-from ray.data.aggregate import AggregateFn, Count, Max, Mean, Min, Std, Sum, Quantile
+from ray.data.aggregate import (
+    AbsMax,
+    AggregateFn,
+    Count,
+    Max,
+    Mean,
+    Min,
+    Std,
+    Sum,
+    Quantile,
+)
+from ray.data.aggregate import _coalesce_aggregations, _count_accumulate_block
+from ray.data.block import BlockAccessor
 from ray.data.context import DataContext
 from ray.data.tests.conftest import *  # noqa
 from ray.data.tests.util import column_udf, named_values, STRICT_MODE
@@ -576,6 +589,93 @@ def test_groupby_tabular_max(ray_start_regular_shared, ds_format, num_parts):
     )
 
 
+@pytest.mark.parametrize("num_parts", [1, 30])
+@pytest.mark.parametrize("ds_format", ["arrow", "pandas"])
+def test_groupby_tabular_abs_max(ray_start_regular_shared, ds_format, num_parts):
+    # Test built-in abs max aggregation
+    seed = int(time.time())
+    print(f"Seeding RNG for test_groupby_tabular_abs_max with: {seed}")
+    random.seed(seed)
+    xs = list(range(100))
+    random.shuffle(xs)
+
+    def _to_pandas(ds):
+        return ds.map_batches(lambda x: x, batch_size=None, batch_format="pandas")
+
+    ds = ray.data.from_items([{"A": (x % 3), "B": x - 50} for x in xs]).repartition(
+        num_parts
+    )
+    if ds_format == "pandas":
+        ds = _to_pandas(ds)
+
+    agg_ds = ds.groupby("A").aggregate(AbsMax("B"))
+    assert agg_ds.count() == 3
+    assert list(agg_ds.sort("A").iter_rows()) == [
+        {"A": 0, "abs_max(B)": 50},
+        {"A": 1, "abs_max(B)": 49},
+        {"A": 2, "abs_max(B)": 48},
+    ]
+    # Test built-in global abs max aggregation
+    assert ds.aggregate(AbsMax("B")) == {"abs_max(B)": 50}
+
+    # Test built-in abs max aggregation with nans
+    ds = ray.data.from_items(
+        [{"A": (x % 3), "B": x - 50} for x in xs] + [{"A": 0, "B": None}]
+    ).repartition(num_parts)
+    if ds_format == "pandas":
+        ds = _to_pandas(ds)
+    nan_grouped_ds = ds.groupby("A")
+    nan_agg_ds = nan_grouped_ds.aggregate(AbsMax("B"))
+    assert nan_agg_ds.count() == 3
+    assert list(nan_agg_ds.sort("A").iter_rows()) == [
+        {"A": 0, "abs_max(B)": 50},
+        {"A": 1, "abs_max(B)": 49},
+        {"A": 2, "abs_max(B)": 48},
+    ]
+    assert ds.aggregate(AbsMax("B")) == {"abs_max(B)": 50}
+    # Test ignore_nulls=False
+    nan_agg_ds = nan_grouped_ds.aggregate(AbsMax("B", ignore_nulls=False))
+    assert nan_agg_ds.count() == 3
+    pd.testing.assert_frame_equal(
+        nan_agg_ds.sort("A").to_pandas(),
+        pd.DataFrame(
+            {
+                "A": [0, 1, 2],
+                "abs_max(B)": [None, 49, 48],
+            }
+        ),
+        check_dtype=False,
+    )
+    assert ds.aggregate(AbsMax("B", ignore_nulls=False)) == {"abs_max(B)": None}
+    # Test all nans
+    ds = ray.data.from_items([{"A": (x % 3), "B": None} for x in xs]).repartition(
+        num_parts
+    )
+    if ds_format == "pandas":
+        ds = _to_pandas(ds)
+    nan_agg_ds = ds.groupby("A").aggregate(AbsMax("B"))
+    assert nan_agg_ds.count() == 3
+    pd.testing.assert_frame_equal(
+        nan_agg_ds.sort("A").to_pandas(),
+        pd.DataFrame(
+            {
+                "A": [0, 1, 2],
+                "abs_max(B)": [None, None, None],
+            }
+        ),
+        check_dtype=False,
+    )
+
+
+@pytest.mark.parametrize("ds_format", ["arrow", "pandas"])
+def test_abs_max_block_int64_min(ds_format):
+    # abs() of the smallest int64 doesn't fit in an int64.
+    block = pd.DataFrame({"A": np.array([3, -(2**63), 5], dtype=np.int64)})
+    if ds_format == "arrow":
+        block = pa.Table.from_pandas(block)
+    assert BlockAccessor.for_block(block).abs_max("A", True) == 2**63
+
+
 @pytest.mark.parametrize("num_parts", [1, 30])
 @pytest.mark.parametrize("ds_format", ["arrow", "pandas"])
 def test_groupby_tabular_mean(ray_start_regular_shared, ds_format, num_parts):
@@ -681,6 +781,16 @@ def test_groupby_tabular_std(ray_start_regular_shared, ds_format, num_parts):
     result = agg_ds.to_pandas()["std(B)"].to_numpy()
     expected = df.groupby("A")["B"].std(ddof=0).to_numpy()
     np.testing.assert_array_almost_equal(result, expected)
+    # ddof >= N is undefined, like in pandas
+    small_df = pd.DataFrame({"A": [0, 0, 1, 1, 1], "B": [1, 2, 3, 5, 8]})
+    ds = ray.data.from_pandas(small_df).repartition(num_parts)
+    if ds_format == "arrow":
+        ds = _to_arrow(ds)
+    agg_ds = ds.groupby("A").std("B", ddof=2)
+    result = agg_ds.sort("A").to_pandas()["std(B)"].to_numpy()
+    expected = small_df.groupby("A")["B"].std(ddof=2).to_numpy()
+    assert np.isnan(result[0])
+    np.testing.assert_array_almost_equal(result, expected)
 
     # Test built-in std aggregation with nans
     nan_df = pd.DataFrame({"A": [x % 3 for x in xs] + [0], "B": xs + [None]})
@@ -712,6 +822,92 @@ def test_groupby_tabular_std(ray_start_regular_shared, ds_format, num_parts):
     np.testing.assert_array_equal(result, expected)
 
 
+@pytest.mark.parametrize("num_parts", [1, 30])
+@pytest.mark.parametrize("ds_format", ["arrow", "pandas"])
+def test_groupby_tabular_quantile(ray_start_regular_shared, ds_format, num_parts):
+    # Test built-in quantile aggregation
+    seed = int(time.time())
+    print(f"Seeding RNG for test_groupby_tabular_quantile with: {seed}")
+    random.seed(seed)
+    xs = list(range(100))
+    random.shuffle(xs)
+
+    def _to_arrow(ds):
+        return ds.map_batches(lambda x: x, batch_size=None, batch_format="pyarrow")
+
+    df = pd.DataFrame({"A": [x % 3 for x in xs], "B": xs})
+    ds = ray.data.from_pandas(df).repartition(num_parts)
+    if ds_format == "arrow":
+        ds = _to_arrow(ds)
+    agg_ds = ds.groupby("A").aggregate(Quantile("B", q=0.3))
+    assert agg_ds.count() == 3
+    result = agg_ds.to_pandas()["quantile(B)"].to_numpy()
+    expected = df.groupby("A")["B"].quantile(0.3).to_numpy()
+    np.testing.assert_array_almost_equal(result, expected)
+
+    # Test exact agreement with NumPy and pandas on float data
+    float_df = pd.DataFrame(
+        {"A": [x % 3 for x in xs], "B": [random.gauss(0, 1000) for _ in xs]}
+    )
+    ds = ray.data.from_pandas(float_df).repartition(num_parts)
+    if ds_format == "arrow":
+        ds = _to_arrow(ds)
+    agg_ds = ds.groupby("A").aggregate(
+        Quantile("B"), Quantile("B", q=0.3, alias_name="q30")
+    )
+    result = agg_ds.sort("A").to_pandas()
+    # NOTE: Compare to Series.quantile rather than to the grouped quantile, which
+    # interpolates differently than NumPy.
+    grouped = float_df.groupby("A")["B"]
+    np.testing.assert_array_equal(
+        result["quantile(B)"].to_numpy(),
+        grouped.apply(lambda s: s.quantile(0.5)).to_numpy(),
+    )
+    np.testing.assert_array_equal(
+        result["q30"].to_numpy(),
+        grouped.apply(lambda s: np.quantile(s, 0.3)).to_numpy(),
+    )
+
+    # Test built-in quantile aggregation with nans
+    nan_df = pd.DataFrame({"A": [x % 3 for x in xs] + [0], "B": xs + [None]})
+    ds = ray.data.from_pandas(nan_df).repartition(num_parts)
+    if ds_format == "arrow":
+        ds = _to_arrow(ds)
+    nan_grouped_ds = ds.groupby("A")
+    nan_agg_ds = nan_grouped_ds.aggregate(Quantile("B"))
+    assert nan_agg_ds.count() == 3
+    result = nan_agg_ds.to_pandas()["quantile(B)"].to_numpy()
+    expected = nan_df.groupby("A")["B"].quantile().to_numpy()
+    np.testing.assert_array_almost_equal(result, expected)
+    # Test ignore_nulls=False
+    nan_agg_ds = nan_grouped_ds.aggregate(Quantile("B", ignore_nulls=False))
+    assert nan_agg_ds.count() == 3
+    result = nan_agg_ds.to_pandas()["quantile(B)"].to_numpy()
+    assert result[0] is None or np.isnan(result[0])
+    np.testing.assert_array_almost_equal(result[1:], expected[1:])
+
+    # Test built-in quantile aggregation on datetime and bool columns
+    df = pd.DataFrame(
+        {
+            "A": [0, 0, 0, 1, 1],
+            "D": pd.to_datetime(
+                ["2021-01-02", "2021-01-01", "2021-01-03", "2021-02-01", "2021-02-03"]
+            ),
+            "B": [True, False, True, False, True],
+        }
+    )
+    ds = ray.data.from_pandas(df).repartition(num_parts)
+    if ds_format == "arrow":
+        ds = _to_arrow(ds)
+    agg_ds = ds.groupby("A").aggregate(Quantile("D"), Quantile("B"))
+    result = agg_ds.sort("A").to_pandas()
+    assert list(result["quantile(D)"]) == [
+        pd.Timestamp("2021-01-02"),
+        pd.Timestamp("2021-02-02"),
+    ]
+    assert list(result["quantile(B)"]) == [1.0, 0.5]
+
+
 @pytest.mark.parametrize("num_parts", [1, 30])
 def test_groupby_arrow_multicolumn(ray_start_regular_shared, num_parts):
     # Test built-in mean aggregation on multiple columns
@@ -845,6 +1041,141 @@ def test_groupby_arrow_multi_agg(ray_start_regular_shared, num_parts):
             assert result == expected
 
 
+@pytest.mark.parametrize("ds_format", ["arrow", "pandas"])
+def test_coalesce_aggregations(ray_start_regular_shared, ds_format):
+    aggs = [Min("A"), Sum("A"), Max("A"), Max("B"), Std("A"), Mean("A")]
+    coalesced = _coalesce_aggregations(aggs)
+    assert [agg.name for agg in coalesced] == [agg.name for agg in aggs]
+    # Only aggregations sharing a computation on the same column are rewritten:
+    # min(A)/max(A) share a min/max scan, and sum(A)/mean(A) share a sum.
+    assert [a is b for a, b in zip(aggs, coalesced)] == [
+        False,
+        False,
+        False,
+        True,
+        True,
+        False,
+    ]
+
+    def _to_pandas(ds):
+        return ds.map_batches(lambda x: x, batch_size=None, batch_format="pandas")
+
+    # The second block only has nulls in A.
+    ds = ray.data.from_items(
+        [
+            {"A": 3, "B": 1},
+            {"A": -1, "B": 2},
+            {"A": 2, "B": 3},
+            {"A": None, "B": 4},
+            {"A": None, "B": 5},
+            {"A": None, "B": 6},
+        ]
+    ).repartition(2)
+    if ds_format == "pandas":
+        ds = _to_pandas(ds)
+    assert ds.aggregate(*aggs) == {
+        "min(A)": -1,
+        "sum(A)": 4,
+        "max(A)": 3,
+        "max(B)": 6,
+        "std(A)": pytest.approx(np.std([3, -1, 2], ddof=1)),
+        "mean(A)": pytest.approx(4 / 3),
+    }
+    # Test ignore_nulls=False
+    assert ds.aggregate(
+        Min("A", ignore_nulls=False),
+        Max("A", ignore_nulls=False),
+        Sum("A", ignore_nulls=False),
+        Mean("A", ignore_nulls=False),
+    ) == {"min(A)": None, "max(A)": None, "sum(A)": None, "mean(A)": None}
+    # Test all nans
+    ds = ray.data.from_items([{"A": None}] * 4).repartition(2)
+    if ds_format == "pandas":
+        ds = _to_pandas(ds)
+    assert ds.aggregate(Min("A"), Max("A")) == {"min(A)": None, "max(A)": None}
+
+
+@pytest.mark.parametrize("ds_format", ["arrow", "pandas"])
+def test_min_max_block_all_nulls(ds_format):
+    block = pd.DataFrame({"A": [None, None]}, dtype="float64")
+    if ds_format == "arrow":
+        block = pa.Table.from_pandas(block)
+    block_acc = BlockAccessor.for_block(block)
+    assert block_acc.min_max("A", True) is None
+    assert block_acc.min_max("A", False) is None
+
+
+@pytest.mark.skipif(STRICT_MODE, reason="Deprecated in strict mode")
+def test_coalesce_aggregations_simple(ray_start_regular_shared):
+    ds = ray.data.from_items([3, -1, 2, None]).repartition(2)
+    assert ds.aggregate(Min(), Max()) == (-1, 3)
+    # Test ignore_nulls=False
+    assert ds.aggregate(Min(ignore_nulls=False), Max(ignore_nulls=False)) == (
+        None,
+        None,
+    )
+    grouped_ds = ds.groupby(lambda x: int(x or 0) % 2)
+    assert grouped_ds.aggregate(Min(), Max()).sort(key=lambda r: r[0]).take(2) == [
+        (0, 2, 2),
+        (1, -1, 3),
+    ]
+
+
+@pytest.mark.parametrize("ds_format", ["arrow", "pandas"])
+def test_groupby_tabular_mean_large_ints(ray_start_regular_shared, ds_format):
+    # Integer sums beyond 2**53 aren't exact in float64, so their mean must be
+    # computed with Python's correctly rounded true division.
+    xs = [2**60 + 667, 2**60 + 388, 2**60 + 807]
+    assert sum(xs) / 3 != float(sum(xs)) / 3
+    df = pd.DataFrame({"A": [0, 0, 0], "B": xs})
+    ds = ray.data.from_pandas(df)
+    if ds_format == "arrow":
+        ds = ds.map_batches(lambda x: x, batch_size=None, batch_format="pyarrow")
+    result = ds.groupby("A").mean("B").take_all()
+    assert result[0]["mean(B)"] == sum(xs) / 3
+
+
+def test_std_finalize_decimal():
+    # Accumulations of decimal columns hold Decimal means, which the batched
+    # finalize can't stack into a float array.
+    agg = Std("X")
+    accs = [
+        [8.0, decimal.Decimal("2.5"), 3, 1],
+        [2.0, decimal.Decimal("2"), 2, 1],
+        None,
+    ]
+    assert agg._finalize_all(accs) == [agg.finalize(a) for a in accs]
+    assert agg._finalize_all(accs) == [2.0, math.sqrt(2.0), None]
+
+
+def test_count_accumulate_block():
+    # A pandas column named "num_rows" must not be mistaken for Arrow's attribute.
+    df = pd.DataFrame({"num_rows": [1, 2, 3], "x": [1, 2, 3]})
+    assert _count_accumulate_block(0, df) == 3
+    assert _count_accumulate_block(2, pa.Table.from_pandas(df)) == 5
+    # Arrow may represent an empty table as an N-row, 0-column table.
+    empty = pa.Table.from_pandas(df).select([])
+    assert empty.num_rows == 3
+    assert _count_accumulate_block(0, empty) == 0
+
+
+def test_aggregate_fn_subclass_without_init(ray_start_regular_shared):
+    # Subclasses that set up the aggregation themselves, without calling
+    # AggregateFn.__init__, don't have the optional attributes set.
+    class SumOfX(AggregateFn):
+        def __init__(self):
+            self.init = lambda k: 0
+            self.merge = lambda a1, a2: a1 + a2
+            self.accumulate_block = lambda a, block: a + sum(
+                BlockAccessor.for_block(block).to_pandas()["x"]
+            )
+            self.finalize = lambda a: a
+            self.name = "sum_x"
+
+    df = pd.DataFrame({"x": [1, 2, 3]})
+    assert ray.data.from_pandas(df).repartition(2).aggregate(SumOfX()) == {"sum_x": 6}
+
+
 @pytest.mark.parametrize("num_parts", [1, 30])
 def test_groupby_arrow_multi_agg_alias(ray_start_regular_shared, num_parts):
     seed = int(time.time())
@@ -1320,6 +1651,58 @@ def test_groupby_simple_max(ray_start_regular_shared, num_parts):
     assert nan_ds.max() is None
 
 
+@pytest.mark.skipif(STRICT_MODE, reason="Deprecated in strict mode")
+@pytest.mark.parametrize("num_parts", [1, 30])
+def test_groupby_simple_abs_max(ray_start_regular_shared, num_parts):
+    # Test built-in abs max aggregation
+    seed = int(time.time())
+    print(f"Seeding RNG for test_groupby_simple_abs_max with: {seed}")
+    random.seed(seed)
+    xs = [x - 50 for x in range(100)]
+    random.shuffle(xs)
+    agg_ds = (
+        ray.data.from_items(xs)
+        .repartition(num_parts)
+        .groupby(lambda x: x % 3)
+        .aggregate(AbsMax())
+    )
+    assert agg_ds.count() == 3
+    assert agg_ds.sort(key=lambda r: r[0]).take(3) == [(0, 48), (1, 50), (2, 49)]
+
+    # Test built-in abs max aggregation with nans
+    nan_grouped_ds = (
+        ray.data.from_items(xs + [None])
+        .repartition(num_parts)
+        .groupby(lambda x: int(x or 0) % 3)
+    )
+    nan_agg_ds = nan_grouped_ds.aggregate(AbsMax())
+    assert nan_agg_ds.count() == 3
+    assert nan_agg_ds.sort(key=lambda r: r[0]).take(3) == [(0, 48), (1, 50), (2, 49)]
+    # Test ignore_nulls=False
+    nan_agg_ds = nan_grouped_ds.aggregate(AbsMax(ignore_nulls=False))
+    assert nan_agg_ds.count() == 3
+    assert nan_agg_ds.sort(key=lambda r: r[0]).take(3) == [(0, None), (1, 50), (2, 49)]
+    # Test all nans
+    nan_agg_ds = (
+        ray.data.from_items([None] * len(xs))
+        .repartition(num_parts)
+        .groupby(lambda x: 0)
+        .aggregate(AbsMax())
+    )
+    assert nan_agg_ds.count() == 1
+    assert nan_agg_ds.sort(key=lambda r: r[0]).take(1) == [(0, None)]
+
+    # Test built-in global abs max aggregation
+    assert ray.data.from_items(xs).repartition(num_parts).aggregate(AbsMax()) == (50,)
+    assert ray.data.range(10).filter(lambda r: r > 10).aggregate(AbsMax()) is None
+
+    # Test built-in global abs max aggregation with nans
+    nan_ds = ray.data.from_items(xs + [None]).repartition(num_parts)
+    assert nan_ds.aggregate(AbsMax()) == (50,)
+    # Test ignore_nulls=False
+    assert nan_ds.aggregate(AbsMax(ignore_nulls=False)) == (None,)
+
+
 @pytest.mark.skipif(STRICT_MODE, reason="Deprecated in strict mode")
 @pytest.mark.parametrize("num_parts", [1, 30])
 def test_groupby_simple_mean(ray_start_regular_shared, num_parts):